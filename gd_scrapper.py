@@ -9,16 +9,223 @@ Glassdoor Job Scraper (gd_scrapper.py)
 
 import argparse
 import asyncio
+import csv
+import functools
 import re
 import os
 import time
 import logging
 import os
 from datetime import datetime
+from urllib.parse import parse_qs, urlparse
 
-import unicodecsv as csv
-from lxml import html
+from lxml import etree, html
 from playwright.async_api import Playwright, async_playwright
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+
+# CSV column order
+FIELDNAMES = ("Name", "Company", "State", "City", "Salary", "Location",
+              "Currency", "Region", "Years of Experience", "Year", "Url")
+
+# Geographic location per place token, to prevent IP-based redirects.
+# The first token contained in the place wins.
+_GEOLOCATIONS = {
+    "new-york": {"latitude": 40.7128, "longitude": -74.0060},
+    "hyderabad": {"latitude": 17.3850, "longitude": 78.4867},
+    "mumbai": {"latitude": 19.0760, "longitude": 72.8777},
+    "bangalore": {"latitude": 12.9716, "longitude": 77.5946},
+    "boston": {"latitude": 42.3601, "longitude": -71.0589},
+}
+
+# Location keywords a job must mention per place token, checked in order.
+# None means the place is too broad to filter on.
+_NEW_YORK_KEYWORDS = ("new york", "nyc", "new-york", "ny")
+_LOCATION_KEYWORDS = {
+    # Country-level mappings
+    "canada": ("canada", "toronto", "vancouver", "montreal", "calgary", "ottawa",
+               "edmonton", "winnipeg", "quebec", "on", "bc", "qc", "ab", "mb", "sk"),
+    "united states": None,
+    "usa": None,
+    "us": None,
+    # Common city mappings
+    "new-york": _NEW_YORK_KEYWORDS,
+    "ny": _NEW_YORK_KEYWORDS,
+    "boston": ("boston", "ma"),
+    "hyderabad": ("hyderabad",),
+    "mumbai": ("mumbai",),
+    "bangalore": ("bangalore", "bengaluru"),
+}
+
+_SEARCH_URL = "https://www.glassdoor.com/Job/index.htm"
+_JOB_CARD_SELECTOR = '[class*="JobCard"]'
+
+# Requests that never feed the extractors and are aborted to save bandwidth
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+# Tracker domains, matched against the request hostname and its subdomains
+_BLOCKED_HOSTS = ("doubleclick.net", "googletagmanager.com", "google-analytics.com",
+                  "segment.com", "segment.io", "hotjar.com")
+
+# Job pages hydrate from Glassdoor's GraphQL endpoint; when that response is
+# seen the row is built from its JSON instead of the rendered HTML
+_JOB_API_PATHS = ("/graph",)
+_JOB_API_TIMEOUT = 2.0  # max seconds to wait for the API response or description
+# Suffix per GraphQL payPeriod; annual pay (or no period) uses the "97K" form
+_PAY_PERIOD_SUFFIXES = {"HOURLY": "/hr", "DAILY": "/day", "WEEKLY": "/wk", "MONTHLY": "/mo"}
+_JOB_TIMEOUT = 20  # seconds allowed per job page, retries included
+# One navigation per job, as slow to load as before; the rest of _JOB_TIMEOUT
+# covers the API wait and the field read
+_JOB_GOTO_TIMEOUT = 15000  # ms
+
+# Used for the search page and API job descriptions. Comments and processing
+# instructions are never read, and skipping the id index saves a hash insert
+# per element on large pages
+_HTML_PARSER = html.HTMLParser(remove_comments=True, remove_pis=True, collect_ids=False)
+
+# Per-field selector fallback chains, read straight from the live job page so
+# the full DOM never has to be serialized and reparsed.
+_ROLE_SELECTORS = (
+    'div[class="JobDetails_jobDetailsHeader__qKuvs"] > h1',
+    'h1[class*="jobTitle"]',
+    'h1',
+)
+_COMPANY_SELECTORS = (
+    'h4[class*="heading_Heading"][class*="heading_Subhead"]',
+    'div[class="JobDetails_jobDetailsHeader__qKuvs"] > a > div > span',
+    'span[class*="employerName"]',
+    'a[class*="employerName"]',
+)
+_LOCATION_SELECTORS = (
+    'div[class="JobDetails_jobDetailsHeader__qKuvs"] > div',
+    'div[class*="location"]',
+    'div[data-test="location"]',
+    'span[class*="location"]',
+    'div[class*="JobDetails_location"]',
+)
+# New format with &nbsp;, parsed with its own regex
+_SALARY_ESTIMATE_SELECTORS = (
+    'div[class*="JobCard_salaryEstimate"]',
+)
+_SALARY_SELECTORS = (
+    'div[class*="SalaryEstimate_averageEstimate"]',
+    'span[class*="salary"]',
+    'div[class*="SalaryEstimate"]',
+)
+# Year and experience are only searched for in the description
+_DESCRIPTION_SELECTORS = (
+    'div[class*="JobDetails_jobDescription"]',
+    'div[class*="jobDescription"]',
+    'body',
+)
+# Rendered description; once it is on the page the API response isn't awaited
+_DESCRIPTION_READY_SELECTOR = ", ".join(_DESCRIPTION_SELECTORS[:-1])
+# (field, selector chain, which text to read), mirroring the old XPaths:
+#   "own"   - first non-empty text node directly inside a match (el/text())
+#   "first" - first non-empty text node anywhere inside a match ((el//text())[1])
+#   "all"   - every text node inside every match, joined (el//text())
+#   "inner" - layout-aware innerText of the first match
+_FIELD_SELECTORS = (
+    ("role", _ROLE_SELECTORS, "own"),
+    ("company", _COMPANY_SELECTORS, "own"),
+    # Employer links wrap the name in child elements
+    ("company_text", ('a[class*="employerName"]',), "first"),
+    ("location", _LOCATION_SELECTORS, "own"),
+    ("salary_estimate", _SALARY_ESTIMATE_SELECTORS, "all"),
+    ("salary", _SALARY_SELECTORS, "all"),
+    ("description", _DESCRIPTION_SELECTORS, "inner"),
+)
+# Walks every chain in the browser so all fields come back in one round trip;
+# each field gets the text of the first selector that yields any. Matches are
+# all checked, as XPath did, so a header's leading block of child elements
+# doesn't hide the location text in the div after it.
+_READ_FIELDS_JS = """
+(fields) => {
+    const textNodes = (node, own) => {
+        if (own) {
+            return [...node.childNodes].filter(child => child.nodeType === Node.TEXT_NODE);
+        }
+        const nodes = [];
+        const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+        while (walker.nextNode()) {
+            nodes.push(walker.currentNode);
+        }
+        return nodes;
+    };
+    const result = {};
+    for (const [name, selectors, mode] of fields) {
+        result[name] = null;
+        for (const selector of selectors) {
+            let text;
+            if (mode === "inner") {
+                const node = document.querySelector(selector);
+                text = node && node.innerText.trim();
+            } else {
+                // A Set, since nested matches would repeat the inner text nodes
+                const nodes = new Set([...document.querySelectorAll(selector)]
+                    .flatMap(node => textNodes(node, mode === "own")));
+                const texts = [...nodes].map(node => node.data.trim()).filter(Boolean);
+                text = mode === "all" ? texts.join(" ") : texts[0];
+            }
+            if (text) {
+                result[name] = text;
+                break;
+            }
+        }
+    }
+    return result;
+}
+"""
+
+_RE_YEAR = re.compile(r'(20\d{2})')
+# "SGD 97K - SGD 144K (Glassdoor est.)"
+_RE_SALARY_ESTIMATE = re.compile(r'([A-Za-z$€£¥₹₩₽₱₪₫₴₺₼₽₾֏؋]+\s*\d+(?:\.\d+)?[KkMmBb]?)(?:\s*-\s*([A-Za-z$€£¥₹₩₽₱₪₫₴₺₼₽₾֏؋]+\s*\d+(?:\.\d+)?[KkMmBb]?))?')
+# "Rs200,000.00 - Rs300,000.00 per month"
+_RE_SALARY_RANGE = re.compile(r'([A-Za-z$€£¥₹₩₽₱₪₫₴₺₼₽₾֏؋]\s*\d{1,3}(?:[,\s]?\d{3})*(?:\.\d+)?)(?:\s*-\s*([A-Za-z$€£¥₹₩₽₱₪₫₴₺₼₽₾֏؋]?\s*\d{1,3}(?:[,\s]?\d{3})*(?:\.\d+)?))?')
+# "$100K - $150K"
+_RE_SALARY_K_RANGE = re.compile(r'([$€£¥₹₩₽₱₪₫₴₺₼₽₾֏؋]\s*\d+\s*[Kk])\s*-\s*([$€£¥₹₩₽₱₪₫₴₺₼₽₾֏؋]?\s*\d+\s*[Kk])')
+# "3-5 years of experience", "at least 4 years of experience", "5+ years experience";
+# one alternation so the description is scanned once, first mention wins
+_RE_EXPERIENCE = re.compile(
+    r'(?P<low>\d+)\s*[-–]\s*(?P<high>\d+)\s*years?\s*(?:of\s*)?experience'
+    r'|(?:minimum\s+(?:of\s*)?|at\s+least\s+)?(?P<years>\d+)\+?\s*years?\s*(?:of\s*)?experience',
+    re.IGNORECASE,
+)
+# "minimum of 2 years", "at least 4 years" without the word experience; only
+# tried when nothing above matched, so "at least 18 years old" can't win
+_RE_EXPERIENCE_MINIMUM = re.compile(
+    r'(?:minimum\s+(?:of\s*)?|at\s+least\s+)(?P<years>\d+)\s*years?',
+    re.IGNORECASE,
+)
+
+
+async def block_unneeded_requests(route):
+    """Abort images, fonts, media, CSS and analytics; let everything else through"""
+    request = route.request
+    if request.resource_type == "document":
+        # Never block a navigation, whatever its URL looks like
+        await route.continue_()
+        return
+    hostname = urlparse(request.url).hostname or ""
+    if (request.resource_type in _BLOCKED_RESOURCE_TYPES
+            or any(hostname == host or hostname.endswith("." + host) for host in _BLOCKED_HOSTS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def wait_for_more_job_cards(page, previous_count, timeout):
+    """Wait until more job cards are rendered than before; False on timeout or
+    when the page navigates away mid-wait"""
+    try:
+        await page.wait_for_function(
+            "([selector, count]) => document.querySelectorAll(selector).length > count",
+            arg=[_JOB_CARD_SELECTOR, previous_count],
+            timeout=timeout,
+        )
+        return True
+    except PlaywrightError:
+        return False
 
 
 # Setup logging
@@ -41,43 +248,46 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 
-async def run(playwright: Playwright, keyword: str, place: str, logger, 
-              batch_size=50, save_interval=100, max_records=500, max_show_more_clicks=17):
-    """Collecting details of all jobs in the provided keyword and place"""
-    
-    logger.info(f"[START] Starting scraping: {keyword} in {place}")
-    start_time = time.time()
-    
-    # Launch a visible browser window
+async def launch_browser(playwright: Playwright):
+    """Launch a visible browser window, shared by every search run in it"""
     try:
-        browser = await playwright.chromium.launch(
+        return await playwright.chromium.launch(
             headless=False,
             channel="chrome",
             slow_mo=150
         )
     except Exception:
         # Fallback to bundled Chromium if Chrome channel unavailable
-        browser = await playwright.chromium.launch(
+        return await playwright.chromium.launch(
             headless=False,
             slow_mo=150
         )
+
+
+async def scrape(browser, keyword: str, place: str, logger, 
+                 batch_size=50, save_interval=100, max_records=500, max_show_more_clicks=17):
+    """Collecting details of all jobs in the provided keyword and place
+    
+    Runs in its own context on an already launched browser, so callers doing
+    many searches pay the browser startup cost only once.
+    """
+    
+    logger.info(f"[START] Starting scraping: {keyword} in {place}")
+    start_time = time.time()
     
     context = await browser.new_context(
         viewport=None,  # real window size
         user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     )
+    # Applies to the search page and every job page opened from this context
+    await context.route("**/*", block_unneeded_requests)
     
     # Override geographic location to prevent IP-based redirects
-    if 'new-york' in place.lower():
-        await context.set_geolocation({"latitude": 40.7128, "longitude": -74.0060})  # NYC
-    elif 'hyderabad' in place.lower():
-        await context.set_geolocation({"latitude": 17.3850, "longitude": 78.4867})  # Hyderabad
-    elif 'mumbai' in place.lower():
-        await context.set_geolocation({"latitude": 19.0760, "longitude": 72.8777})  # Mumbai
-    elif 'bangalore' in place.lower():
-        await context.set_geolocation({"latitude": 12.9716, "longitude": 77.5946})  # Bangalore
-    elif 'boston' in place.lower():
-        await context.set_geolocation({"latitude": 42.3601, "longitude": -71.0589})  # Boston
+    place_lower = place.lower()
+    for token, geolocation in _GEOLOCATIONS.items():
+        if token in place_lower:
+            await context.set_geolocation(geolocation)
+            break
     
     # Grant permissions after geolocation
     await context.grant_permissions(["geolocation"])
@@ -88,15 +298,14 @@ async def run(playwright: Playwright, keyword: str, place: str, logger,
     try:
         # Form-based search like new_scraper.py
         logger.info(f"[LOAD] Navigating to Glassdoor job search page...")
-        await page.goto("https://www.glassdoor.com/Job/index.htm", wait_until="domcontentloaded", timeout=60000)
-        await page.wait_for_timeout(timeout=1500)  # Shorter wait for page to load
+        await page.goto(_SEARCH_URL, wait_until="domcontentloaded", timeout=60000)
+        await page.wait_for_selector('#searchBar-jobTitle', timeout=10000)
         
         # Find and fill job title field
         logger.info(f"[INPUT] Entering job title: {keyword}")
         job_title_input = page.locator('#searchBar-jobTitle')
         await job_title_input.click()
         await job_title_input.fill(keyword)
-        await page.wait_for_timeout(timeout=500)  # Brief pause
         
         # Find and fill location field - convert place to readable format
         # Handle formats like "new-york-ny" -> "New York"
@@ -108,23 +317,31 @@ async def run(playwright: Playwright, keyword: str, place: str, logger,
         location_input = page.locator('#searchBar-location')
         await location_input.click()
         await location_input.fill(location_text)
-        await page.wait_for_timeout(timeout=500)  # No suggestion wait; continue
         
         # Submit the form by pressing Enter (more reliable)
         logger.info(f"[SUBMIT] Submitting search form (Enter key)...")
+        # The search page may already have redirected (e.g. to a localized
+        # domain), so compare against the URL we submit from
+        before = page.url
         try:
             await location_input.press('Enter')
         except Exception:
             # Fallback: press Enter on the page if the location input lost focus
             await page.keyboard.press('Enter')
         
-        # Wait for results page to load
+        # Wait for results page to load; the search page may already show
+        # job cards, so wait for the URL to change before looking for them
         logger.info(f"[WAIT] Waiting for search results...")
-        await page.wait_for_timeout(timeout=1000)
+        try:
+            # "commit" returns once the new URL is live rather than waiting
+            # for every subresource of a full navigation to load
+            await page.wait_for_url(lambda url: url != before, wait_until="commit", timeout=10000)
+        except PlaywrightTimeoutError:
+            pass
         
         # Wait for job listings to appear
         try:
-            await page.wait_for_selector('[class*="JobCard"]', timeout=10000)
+            await page.wait_for_selector(_JOB_CARD_SELECTOR, timeout=10000)
             logger.info(f"[LOADED] Search results page loaded")
         except:
             logger.warning(f"[WARNING] Job cards not found, continuing anyway...")
@@ -136,6 +353,7 @@ async def run(playwright: Playwright, keyword: str, place: str, logger,
             for i in range(max_show_more_clicks):
                 load_more_btn = page.locator('button[data-test="load-more"]')
                 if await load_more_btn.is_visible():
+                    job_cards = await page.locator(_JOB_CARD_SELECTOR).count()
                     await load_more_btn.click()
                     # First time only: wait up to 5s for popup; press Escape to dismiss
                     if not popup_closed:
@@ -143,15 +361,15 @@ async def run(playwright: Playwright, keyword: str, place: str, logger,
                             # If a dialog appears, dismiss immediately
                             await page.wait_for_selector('[role="dialog"]', timeout=5000)
                             await page.keyboard.press('Escape')
-                            popup_closed = True
-                            await page.wait_for_timeout(timeout=250)
+                            await page.wait_for_selector('[role="dialog"]', state='hidden', timeout=2000)
                         except Exception:
-                            # Even if no dialog detected, press Escape after 5s as a fallback
-                            await page.wait_for_timeout(timeout=5000)
+                            # Even if no dialog detected, press Escape as a fallback
                             await page.keyboard.press('Escape')
-                            popup_closed = True
-                            await page.wait_for_timeout(timeout=250)
-                    await page.wait_for_timeout(timeout=800)
+                        popup_closed = True
+                    # Continue as soon as the next page of cards has rendered;
+                    # stop clicking if the button no longer loads any
+                    if not await wait_for_more_job_cards(page, job_cards, timeout=5000):
+                        break
                 else:
                     break
         except Exception as e:
@@ -160,12 +378,15 @@ async def run(playwright: Playwright, keyword: str, place: str, logger,
         # Scroll to load more jobs
         logger.info(f"[SCROLL] Scrolling to load more jobs...")
         for _ in range(5):  # Scroll multiple times to load more
+            job_cards = await page.locator(_JOB_CARD_SELECTOR).count()
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await page.wait_for_timeout(timeout=2000)
+            # Stop scrolling once a scroll no longer loads any new cards
+            if not await wait_for_more_job_cards(page, job_cards, timeout=2000):
+                break
         
         # Get page content and extract job links
         response = await page.content()
-        tree = html.fromstring(response)
+        tree = html.fromstring(response, parser=_HTML_PARSER)
         
         # Collecting urls to each job description page - try multiple selectors
         links = tree.xpath('//a[contains(@href, "/job-listing/")]/@href')
@@ -196,7 +417,7 @@ async def run(playwright: Playwright, keyword: str, place: str, logger,
         
         job_listings = []
         
-        # Process jobs in batches for better performance
+        # Process jobs concurrently, at most batch_size pages at a time
         total_jobs = len(links)
         successful_jobs = 0
         
@@ -215,12 +436,49 @@ async def run(playwright: Playwright, keyword: str, place: str, logger,
         # Temporary storage for jobs before saving
         pending_jobs = []
         
-        for batch_start in range(0, len(links), batch_size):
-            batch_links = links[batch_start:batch_start + batch_size]
-            batch_jobs = await process_batch(context, batch_links, batch_start + 1, logger)
-            job_listings.extend(batch_jobs)
-            pending_jobs.extend(batch_jobs)
-            successful_jobs += len(batch_jobs)
+        # Pages whose renderer crashed; they stay open but every call on them fails
+        crashed_pages = set()
+        
+        async def new_worker_page():
+            worker_page = await context.new_page()
+            worker_page.on("crash", crashed_pages.add)
+            return worker_page
+        
+        # One reusable page per worker slot; the pool size bounds concurrency
+        worker_pages = [await new_worker_page() for _ in range(min(batch_size, len(links)))]
+        page_pool = asyncio.Queue()
+        for worker_page in worker_pages:
+            page_pool.put_nowait(worker_page)
+        
+        processed = 0
+        
+        async def process_pooled(link, idx):
+            job_page = await page_pool.get()
+            try:
+                # Bound the whole job, retries included, so one stuck page
+                # can't hold its slot for minutes
+                async with asyncio.timeout(_JOB_TIMEOUT):
+                    job_data = await process_single_job(job_page, link, idx, logger)
+            except TimeoutError:
+                logger.warning(f"⚠️ Failed job {idx}: timed out after {_JOB_TIMEOUT}s")
+                job_data = None
+            finally:
+                if job_page.is_closed() or job_page in crashed_pages:
+                    # A dead page fails every job at once and would keep
+                    # taking the next one, so give the slot a fresh page
+                    logger.warning(f"[PAGE] Replacing closed or crashed page after job {idx}")
+                    slot = worker_pages.index(job_page)
+                    job_page = worker_pages[slot] = await new_worker_page()
+                page_pool.put_nowait(job_page)
+            record_job(job_data)
+        
+        def record_job(job_data):
+            nonlocal processed, successful_jobs, pending_jobs, is_first_batch
+            processed += 1
+            if job_data:
+                job_listings.append(job_data)
+                pending_jobs.append(job_data)
+                successful_jobs += 1
             
             # Save to CSV after accumulating 100 jobs
             if len(pending_jobs) >= save_interval:
@@ -235,11 +493,16 @@ async def run(playwright: Playwright, keyword: str, place: str, logger,
                     pending_jobs = []  # Reset the pending jobs
             
             # Clean progress update
-            processed = min(batch_start + batch_size, len(links))
             print(f"Progress: {processed}/{total_jobs} jobs processed | {successful_jobs} successful | Pending save: {len(pending_jobs)} jobs")
-            
-            # Increased delay for stability
-            await asyncio.sleep(1.0)
+        
+        # Schedule every job up front; a slow page only holds its own slot
+        # instead of stalling the rest of a fixed batch
+        async with asyncio.TaskGroup() as task_group:
+            for idx, link in enumerate(links, 1):
+                task_group.create_task(process_pooled(link, idx))
+        
+        for worker_page in worker_pages:
+            await worker_page.close()
         
         # Save any remaining jobs that didn't reach the 100-job threshold
         if pending_jobs:
@@ -247,7 +510,7 @@ async def run(playwright: Playwright, keyword: str, place: str, logger,
             is_first_batch = False
             print(f"Saved final {len(pending_jobs)} jobs to CSV")
         
-        await browser.close()
+        await context.close()
         
         # Location filter disabled - return all jobs
         elapsed_time = time.time() - start_time
@@ -260,7 +523,7 @@ async def run(playwright: Playwright, keyword: str, place: str, logger,
         
     except Exception as e:
         logger.error(f"Error in {keyword}-{place}: {str(e)}")
-        await browser.close()
+        await context.close()
         return []
 
 
@@ -276,130 +539,104 @@ def save_jobs_to_csv(jobs, filename, is_first_batch=False):
     # Update filename to include output directory
     filename = os.path.join(output_dir, os.path.basename(filename))
     
-    # Define fieldnames for CSV
-    fieldnames = ["Name", "Company", "State", "City", "Salary", "Location", 
-                 "Currency", "Region", "Years of Experience", "Year", "Url"]
-    
-    # Check if file exists to determine if we need to write header
-    file_exists = os.path.exists(filename)
+    # Write header only if file is new or it's the first batch (which overwrites it)
+    write_header = not os.path.exists(filename) or is_first_batch
     
     try:
-        with open(filename, 'ab') as csvfile:  # 'ab' mode to append in binary mode
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames, 
-                                  quoting=csv.QUOTE_ALL)
-            
-            # Write header only if file is new or it's the first batch
-            if not file_exists or is_first_batch:
-                # Need to write in text mode for the header to handle encoding properly
-                with open(filename, 'wb') as f:
-                    f.write(','.join(f'"{field}"' for field in fieldnames).encode('utf-8') + b'\n')
+        with open(filename, 'w' if write_header else 'a', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile, quoting=csv.QUOTE_ALL)
+            if write_header:
+                writer.writerow(FIELDNAMES)
             
             # Write the job data
-            for job in jobs:
-                writer.writerow(job)
-                
+            writer.writerows(tuple(job[field] for field in FIELDNAMES) for job in jobs)
+            
     except Exception as e:
         print(f"Error saving to CSV: {str(e)}")
 
 
+def _location_keywords(place):
+    """Return the location keywords expected for a place, or None to keep all jobs"""
+    place_lower = place.lower()
+    for token, keywords in _LOCATION_KEYWORDS.items():
+        if token in place_lower:
+            return keywords
+    # Generic: extract city name from place parameter
+    return (place_lower.split('-')[0],)
+
+
+@functools.lru_cache(maxsize=None)
+def _location_pattern(place):
+    """Compile the expected keywords for a place into one alternation regex"""
+    expected_keywords = _location_keywords(place)
+    if expected_keywords is None:
+        return None
+    return re.compile("|".join(re.escape(keyword) for keyword in expected_keywords))
+
+
 def filter_jobs_by_location(job_listings, place):
     """Filter jobs to only include those matching the target location"""
     if not job_listings:
         return job_listings
     
     # Extract expected location keywords from place parameter
-    place_lower = place.lower()
-    expected_keywords = []
-    
-    # Country-level mappings
-    if 'canada' in place_lower:
-        expected_keywords = ['canada', 'toronto', 'vancouver', 'montreal', 'calgary', 'ottawa', 
-                           'edmonton', 'winnipeg', 'quebec', 'on', 'bc', 'qc', 'ab', 'mb', 'sk']
-    elif 'united states' in place_lower or 'usa' in place_lower or 'us' in place_lower:
+    location_pattern = _location_pattern(place)
+    if location_pattern is None:
         # Don't filter - too broad
         return job_listings
-    # Common city mappings
-    elif 'new-york' in place_lower or 'ny' in place_lower:
-        expected_keywords = ['new york', 'nyc', 'new-york', 'ny']
-    elif 'boston' in place_lower:
-        expected_keywords = ['boston', 'ma']
-    elif 'hyderabad' in place_lower:
-        expected_keywords = ['hyderabad']
-    elif 'mumbai' in place_lower:
-        expected_keywords = ['mumbai']
-    elif 'bangalore' in place_lower:
-        expected_keywords = ['bangalore', 'bengaluru']
-    else:
-        # Generic: extract city name from place parameter
-        city_name = place_lower.split('-')[0] if '-' in place_lower else place_lower
-        expected_keywords = [city_name]
-    
-    filtered_jobs = []
-    for job in job_listings:
-        location_lower = job.get('Location', '').lower()
-        city_lower = job.get('City', '').lower()
-        state_lower = job.get('State', '').lower()
-        region_lower = job.get('Region', '').lower()
-        
-        # Check if any location field contains expected keywords
-        matches = False
-        for keyword in expected_keywords:
-            if keyword in location_lower or keyword in city_lower or keyword in region_lower or keyword in state_lower:
-                matches = True
-                break
-        
-        if matches:
-            filtered_jobs.append(job)
     
-    return filtered_jobs
-
-
-async def process_batch(context, links, start_idx, logger, batch_size=50):
-    """Process a batch of job links concurrently"""
-    tasks = []
-    
-    for idx, link in enumerate(links, start_idx):
-        task = process_single_job(context, link, idx, logger)
-        tasks.append(task)
-    
-    # Process batch concurrently
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    
-    # Filter out exceptions and None values, return only valid jobs
-    valid_jobs = []
-    for result in results:
-        if isinstance(result, dict) and result is not None:
-            valid_jobs.append(result)
-        elif isinstance(result, Exception):
-            logger.warning(f"⚠️ Job processing failed: {str(result)}")
-        # Skip None values (failed jobs)
-    
-    return valid_jobs
+    # Check all location fields for any expected keyword in a single pass;
+    # the NUL separator keeps a keyword from matching across two fields
+    return [
+        job for job in job_listings
+        if location_pattern.search("\x00".join((
+            job.get('Location', ''), job.get('City', ''),
+            job.get('Region', ''), job.get('State', ''),
+        )).lower())
+    ]
 
 
-async def process_single_job(context, link, idx, logger):
-    """Process a single job page"""
+async def process_single_job(page, link, idx, logger):
+    """Process a single job page on a page borrowed from the worker pool"""
     try:
-        page = await context.new_page()
-        # Retry logic for failed pages
-        max_retries = 3
-        for attempt in range(max_retries):
+        api_jobview = asyncio.get_running_loop().create_future()
+        listing_id = _link_listing_id(link)
+        
+        async def capture_job_api(response):
+            # Without a listing id in the link the response can't be matched
+            # to this job, so the rendered page is always used
+            if (listing_id is None or api_jobview.done()
+                    or not any(path in response.url for path in _JOB_API_PATHS)):
+                return
             try:
-                await page.goto(link, wait_until="domcontentloaded", timeout=15000)
-                await page.wait_for_timeout(timeout=500)  # Increased delay for stability
-                break
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise e
-                await page.wait_for_timeout(timeout=1000)  # Wait before retry
-        
-        response = await page.content()
-        tree = html.fromstring(response)
-        
-        # Extract job data (same logic as scraper_fast.py)
-        job_data = extract_job_data(tree, link)
+                jobview = _find_jobview(await response.json())
+            except Exception:
+                return
+            # Ignore responses for other listings (e.g. late ones for the
+            # previous job on this reused page)
+            if (jobview and _jobview_listing_id(jobview) == listing_id
+                    and not api_jobview.done()):
+                api_jobview.set_result(jobview)
+        
+        page.on("response", capture_job_api)
+        try:
+            # No retries: after a slow first attempt a second one couldn't
+            # finish inside _JOB_TIMEOUT, and a failed job only costs its row
+            await page.goto(link, wait_until="domcontentloaded", timeout=_JOB_GOTO_TIMEOUT)
+            
+            jobview = await _wait_for_jobview(page, api_jobview)
+        finally:
+            # The page is reused for the next job; don't leak this listener
+            page.remove_listener("response", capture_job_api)
         
-        await page.close()
+        if jobview:
+            job_data = job_data_from_api(jobview, link)
+        else:
+            # No API response seen, fall back to reading the rendered page
+            fields = await read_job_fields(page)
+            
+            # Extract job data (same logic as scraper_fast.py)
+            job_data = extract_job_data(fields, link)
         
         return job_data
         
@@ -409,69 +646,194 @@ async def process_single_job(context, link, idx, logger):
         return None
 
 
-def extract_job_data(tree, link):
-    """Extract job data from HTML tree"""
+async def _wait_for_jobview(page, api_jobview):
+    """Wait for the API jobview or the rendered description, whichever is first
+    
+    Returns the jobview if it arrived, else None so the page is read instead;
+    server-rendered pages thus don't sit out the whole _JOB_API_TIMEOUT.
+    """
+    description_ready = asyncio.ensure_future(
+        page.wait_for_selector(_DESCRIPTION_READY_SELECTOR, timeout=_JOB_API_TIMEOUT * 1000))
+    try:
+        await asyncio.wait({api_jobview, description_ready}, timeout=_JOB_API_TIMEOUT,
+                           return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        if description_ready.done():
+            # Retrieve a selector timeout so it isn't logged as unhandled
+            description_ready.exception()
+        else:
+            description_ready.cancel()
+    return api_jobview.result() if api_jobview.done() else None
+
+
+def _link_listing_id(link):
+    """Return the job listing id from a job link's jl/jobListingId parameter"""
+    query = parse_qs(urlparse(link).query)
+    for key in ("jl", "jobListingId"):
+        if query.get(key):
+            return query[key][0]
+    return None
+
+
+def _jobview_listing_id(jobview):
+    """Return the job listing id a GraphQL jobview object describes, as a string"""
+    listing_id = ((jobview.get("job") or {}).get("listingId")
+                  or (jobview.get("header") or {}).get("jobListingId"))
+    return str(listing_id) if listing_id is not None else None
+
+
+def _find_jobview(payload):
+    """Return the jobview object from a Glassdoor GraphQL response, if any"""
+    # Batched GraphQL requests come back as a list of responses
+    responses = payload if isinstance(payload, list) else [payload]
+    for response in responses:
+        if isinstance(response, dict):
+            jobview = (response.get("data") or {}).get("jobview")
+            if jobview:
+                return jobview
+    return None
+
+
+def job_data_from_api(jobview, link):
+    """Extract job data from a GraphQL jobview object"""
+    header = jobview.get("header") or {}
+    job = jobview.get("job") or {}
+    
+    role = header.get("jobTitleText") or job.get("jobTitleText") or "N/A"
+    company_name = (header.get("employerNameFromSearch")
+                    or (header.get("employer") or {}).get("name") or _company_from_link(link))
+    location = header.get("locationName") or "N/A"
+    
+    # Salary - annual pay in the "SGD 97K - SGD 144K" shape of the on-page
+    # estimate, other periods as "USD 22.5 - USD 31 /hr"
+    salary = "N/A"
+    pay = header.get("payPeriodAdjustedPay") or {}
+    currency_code = header.get("payCurrency") or ""
+    period_suffix = _PAY_PERIOD_SUFFIXES.get((header.get("payPeriod") or "").upper())
+    if period_suffix:
+        amounts = [f"{pay[key]:,.2f}".rstrip("0").rstrip(".") for key in ("p10", "p90") if pay.get(key)]
+    else:
+        amounts = [f"{round(pay[key] / 1000)}K" for key in ("p10", "p90") if pay.get(key)]
+    if amounts:
+        salary = " - ".join(f"{currency_code} {amount}".strip() for amount in amounts)
+        if period_suffix:
+            salary = f"{salary} {period_suffix}"
+    
+    # The description is HTML; join its text nodes like the page path's
+    # //text() did, which also decodes entities such as &nbsp; and &ndash;
+    try:
+        description = " ".join(
+            html.fromstring(job.get("description") or "", parser=_HTML_PARSER).itertext())
+    except etree.ParserError:
+        # Missing, blank or comment-only description
+        description = ""
+    year = _find_year(description)
+    years_of_experience = _find_years_of_experience(description)
+    
+    return _job_record(link, role, company_name, location, salary, year, years_of_experience)
+
+
+async def read_job_fields(page):
+    """Read the raw text of each job field from the live page in one evaluate call"""
+    return await page.evaluate(_READ_FIELDS_JS, _FIELD_SELECTORS)
+
+
+def extract_job_data(fields, link):
+    """Extract job data from the raw field texts read by read_job_fields"""
     # Job title
-    role_elements = tree.xpath('//div[@class="JobDetails_jobDetailsHeader__qKuvs"]/h1/text()')
-    if not role_elements:
-        role_elements = tree.xpath('//h1[contains(@class, "jobTitle")]/text()')
-    if not role_elements:
-        role_elements = tree.xpath('//h1/text()')
-    role = role_elements[0].strip() if role_elements else "N/A"
-    
-    # Company name - try multiple selectors
-    company_elements = tree.xpath('//h4[contains(@class, "heading_Heading") and contains(@class, "heading_Subhead")]/text()')
-    if not company_elements:
-        company_elements = tree.xpath('//div[@class="JobDetails_jobDetailsHeader__qKuvs"]/a/div/span/text()')
-    if not company_elements:
-        company_elements = tree.xpath('//span[contains(@class, "employerName")]/text()')
-    if not company_elements:
-        company_elements = tree.xpath('//a[contains(@class, "employerName")]/text()')
-    if not company_elements:
-        # Try to get from href or data attributes
-        company_elements = tree.xpath('//a[contains(@class, "employerName")]//text()')
-    if not company_elements:
-        # Extract from URL as fallback
-        try:
-            if "/job-listing/" in link and "-JV_" in link:
-                # Pattern: .../job-listing/job-title-company-name-JV_...
-                url_part = link.split("/job-listing/")[1].split("-JV_")[0]
-                words = url_part.split("-")
-                # Company name is usually at the end, try last 2-3 words
-                if len(words) > 2:
-                    # Try last 2 words as company name
-                    company_parts = words[-2:]
-                    company_name = " ".join(company_parts).title()
-                    company_elements = [company_name]
-            elif "/job-listing/" in link:
-                # Simpler pattern without JV_
-                url_part = link.split("/job-listing/")[1].split("?")[0]
-                words = url_part.split("-")
-                if len(words) > 2:
-                    company_parts = words[-2:]
-                    company_name = " ".join(company_parts).title()
-                    company_elements = [company_name]
-        except:
-            pass
-    company_name = company_elements[0].strip() if company_elements else "N/A"
-    
-    # Location - try multiple selectors
-    location = "N/A"
-    # Try different location selectors
-    location_selectors = [
-        '//div[@class="JobDetails_jobDetailsHeader__qKuvs"]/div/text()',
-        '//div[contains(@class, "location")]/text()',
-        '//div[@data-test="location"]/text()',
-        '//span[contains(@class, "location")]/text()',
-        '//div[contains(@class, "JobDetails_location")]/text()'
-    ]
+    role = fields["role"] or "N/A"
     
-    for selector in location_selectors:
-        location_elements = tree.xpath(selector)
-        if location_elements and location_elements[0].strip():
-            location = location_elements[0].strip()
-            break
+    # Company name - first of multiple selectors, else guessed from the URL
+    company = fields["company"] or fields["company_text"]
+    company_name = company.strip() if company else _company_from_link(link)
+    
+    # Location - first of multiple selectors
+    location = fields["location"] or "N/A"
+    
+    # Year and experience are only searched for in the description
+    description = fields["description"] or ""
+    year = _find_year(description)
+    years_of_experience = _find_years_of_experience(description)
     
+    # Salary - try multiple selectors and formats
+    salary = _parse_salary(fields["salary_estimate"], fields["salary"])
+    
+    return _job_record(link, role, company_name, location, salary, year, years_of_experience)
+
+
+def _company_from_link(link):
+    """Guess the company name from the last words of the job listing URL"""
+    try:
+        if "/job-listing/" in link and "-JV_" in link:
+            # Pattern: .../job-listing/job-title-company-name-JV_...
+            url_part = link.split("/job-listing/")[1].split("-JV_")[0]
+        elif "/job-listing/" in link:
+            # Simpler pattern without JV_
+            url_part = link.split("/job-listing/")[1].split("?")[0]
+        else:
+            return "N/A"
+        words = url_part.split("-")
+        # Company name is usually at the end, try last 2 words
+        if len(words) > 2:
+            return " ".join(words[-2:]).title()
+    except:
+        pass
+    return "N/A"
+
+
+def _parse_salary(estimate_text, salary_text):
+    """Pull a salary range out of the estimate text, else the generic salary text"""
+    if estimate_text:
+        # Special handling for the new format with &nbsp;
+        estimate_text = ' '.join(estimate_text.split())
+        # Extract the salary range (e.g., "SGD 97K - SGD 144K (Glassdoor est.)")
+        range_match = _RE_SALARY_ESTIMATE.search(estimate_text)
+        if range_match:
+            min_sal = range_match.group(1).strip()
+            max_sal = range_match.group(2).strip() if range_match.group(2) else ""
+            return f"{min_sal} - {max_sal}" if max_sal else min_sal
+    
+    if not salary_text:
+        return "N/A"
+    salary_text = ' '.join(salary_text.split())
+    
+    # Try to extract salary ranges in various formats
+    # Format 1: Rs200,000.00 - Rs300,000.00 per month
+    range_match = _RE_SALARY_RANGE.search(salary_text)
+    if range_match:
+        min_sal = range_match.group(1).strip()
+        max_sal = range_match.group(2).strip() if range_match.group(2) else ""
+        return f"{min_sal} - {max_sal}" if max_sal else min_sal
+    
+    # Format 2: $100K - $150K
+    k_range_match = _RE_SALARY_K_RANGE.search(salary_text)
+    if k_range_match:
+        min_sal = k_range_match.group(1).strip()
+        max_sal = k_range_match.group(2).strip()
+        return f"{min_sal} - {max_sal}"
+    
+    # If no specific format matched, use the text as is (truncated)
+    return salary_text[:100].strip()
+
+
+def _find_year(text):
+    """Return the first 20xx year mentioned in the text"""
+    year_match = _RE_YEAR.search(text)
+    return year_match.group(1) if year_match else "N/A"
+
+
+def _find_years_of_experience(page_text_str):
+    """Return the required experience mentioned in the description text"""
+    match = _RE_EXPERIENCE.search(page_text_str) or _RE_EXPERIENCE_MINIMUM.search(page_text_str)
+    if not match:
+        return "N/A"
+    if match.groupdict().get('low'):
+        return f"{match.group('low')}-{match.group('high')} years"
+    return f"{match.group('years')}+ years"
+
+
+def _job_record(link, role, company_name, location, salary, year, years_of_experience):
+    """Derive city, state and region from the location and build the CSV row"""
     # Parse city and state
     try:
         if "," in location:
@@ -485,111 +847,12 @@ def extract_job_data(tree, link):
         city = "N/A"
         state = "N/A"
     
-    # Year
-    year = "N/A"
-    try:
-        page_text = tree.xpath('//text()')
-        page_text_str = " ".join(page_text)
-        year_match = re.search(r'(20\d{2})', page_text_str)
-        if year_match:
-            year = year_match.group(1)
-    except:
-        pass
-    
-    # Salary - try multiple selectors and formats
-    salary = "N/A"
-    salary_selectors = [
-        '//div[contains(@class, "JobCard_salaryEstimate")]',  # New format with &nbsp;
-        '//div[contains(@class, "SalaryEstimate_averageEstimate")]//text()',
-        '//span[contains(@class, "salary")]//text()',
-        '//div[contains(@class, "SalaryEstimate")]//text()',
-        '//p[contains(translate(., "PAY", "pay"), "pay")]//text()',
-        '//*[contains(translate(., "SALARY", "salary"), "salary")]//text()'
-    ]
-    
-    for selector in salary_selectors:
-        if 'JobCard_salaryEstimate' in selector:
-            # Special handling for the new format with &nbsp;
-            salary_div = tree.xpath(selector)
-            if salary_div:
-                # Get the entire text content including &nbsp;
-                salary_text = html.tostring(salary_div[0], method='text', encoding='unicode')
-                # Clean up the text
-                salary_text = ' '.join(salary_text.split())
-                # Extract the salary range (e.g., "SGD 97K - SGD 144K (Glassdoor est.)")
-                range_match = re.search(r'([A-Za-z$€£¥₹₩₽₱₪₫₴₺₼₽₾֏؋]+\s*\d+(?:\.\d+)?[KkMmBb]?)(?:\s*-\s*([A-Za-z$€£¥₹₩₽₱₪₫₴₺₼₽₾֏؋]+\s*\d+(?:\.\d+)?[KkMmBb]?))?', salary_text)
-                if range_match:
-                    min_sal = range_match.group(1).strip()
-                    max_sal = range_match.group(2).strip() if range_match.group(2) else ""
-                    salary = f"{min_sal} - {max_sal}" if max_sal else min_sal
-                    break
-        else:
-            # Original handling for other selectors
-            salary_elements = tree.xpath(selector)
-            if salary_elements:
-                salary_text = " ".join([s.strip() for s in salary_elements if s.strip()])
-                if salary_text:
-                    # Try to extract salary ranges in various formats
-                    # Format 1: Rs200,000.00 - Rs300,000.00 per month
-                    range_match = re.search(r'([A-Za-z$€£¥₹₩₽₱₪₫₴₺₼₽₾֏؋]\s*\d{1,3}(?:[,\s]?\d{3})*(?:\.\d+)?)(?:\s*-\s*([A-Za-z$€£¥₹₩₽₱₪₫₴₺₼₽₾֏؋]?\s*\d{1,3}(?:[,\s]?\d{3})*(?:\.\d+)?))?', salary_text)
-                    if range_match:
-                        min_sal = range_match.group(1).strip()
-                        max_sal = range_match.group(2).strip() if range_match.group(2) else ""
-                        salary = f"{min_sal} - {max_sal}" if max_sal else min_sal
-                        break
-                    
-                    # Format 2: $100K - $150K
-                    k_range_match = re.search(r'([$€£¥₹₩₽₱₪₫₴₺₼₽₾֏؋]\s*\d+\s*[Kk])\s*-\s*([$€£¥₹₩₽₱₪₫₴₺₼₽₾֏؋]?\s*\d+\s*[Kk])', salary_text)
-                    if k_range_match:
-                        min_sal = k_range_match.group(1).strip()
-                        max_sal = k_range_match.group(2).strip()
-                        salary = f"{min_sal} - {max_sal}"
-                        break
-                    
-                    # If no specific format matched, use the text as is (truncated)
-                    salary = salary_text[:100].strip()
-                    break
-    
     # Currency set to null as requested
     currency = None
     
     # Region
     region = location if location != "N/A" else f"{city}, {state}" if city != "N/A" and state != "N/A" else "N/A"
     
-    # Years of Experience
-    years_of_experience = "N/A"
-    try:
-        requirements_text = tree.xpath('//div[contains(@class, "JobDetails_jobDescription")]//text()')
-        if not requirements_text:
-            requirements_text = tree.xpath('//div[contains(@class, "jobDescription")]//text()')
-        if not requirements_text:
-            requirements_text = tree.xpath('//text()')
-        
-        page_text_str = " ".join(requirements_text)
-        
-        exp_patterns = [
-            r'(\d+)\+?\s*years?\s*of?\s*experience',
-            r'minimum\s+of?\s*(\d+)\s*years?',
-            r'at\s+least\s+(\d+)\s*years?',
-            r'(\d+)[-–](\d+)\s*years?\s*(of\s*)?experience',
-            r'(\d+)\s*years?\s*(of\s*)?experience',
-        ]
-        
-        for pattern in exp_patterns:
-            matches = re.finditer(pattern, page_text_str, re.IGNORECASE)
-            for match in matches:
-                groups = match.groups()
-                if len(groups) == 2 and all(g and g.isdigit() for g in groups):
-                    years_of_experience = f"{groups[0]}-{groups[1]} years"
-                    break
-                elif len(groups) >= 1 and groups[0] and groups[0].isdigit():
-                    years_of_experience = f"{groups[0]}+ years"
-                    break
-            if years_of_experience != "N/A":
-                break
-    except:
-        pass
-    
     return {
         "Name": role,
         "Company": company_name,
@@ -617,8 +880,12 @@ async def main(keyword: str, place: str, batch_size=50, save_interval=100,
     print("="*60)
     
     async with async_playwright() as playwright:
-        result = await run(playwright, keyword, place, logger, 
-                         batch_size, save_interval, max_records, max_show_more_clicks)
+        browser = await launch_browser(playwright)
+        try:
+            result = await scrape(browser, keyword, place, logger, 
+                                  batch_size, save_interval, max_records, max_show_more_clicks)
+        finally:
+            await browser.close()
     return result
 
 
@@ -629,7 +896,7 @@ def parse(keyword: str, place: str, batch_size=50, save_interval=100,
     Args:
         keyword: Job title to search for
         place: Location to search in (e.g., 'new-york-ny')
-        batch_size: Number of jobs to process in each batch
+        batch_size: Maximum number of job pages processed concurrently
         save_interval: Save progress after this many records
         max_records: Maximum number of jobs to scrape
         max_show_more_clicks: Number of times to click 'Show more jobs' button
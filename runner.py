@@ -1,64 +1,122 @@
+import asyncio
 import csv
 import os
-from gd_scrapper import parse
 
-def read_csv(filename):
-    """Read CSV file and return list of dictionaries"""
+import pyarrow as pa
+import pyarrow.parquet as pq
+from playwright.async_api import async_playwright
+
+from gd_scrapper import FIELDNAMES, launch_browser, scrape, setup_logging
+
+# Combined results of every job/location pair
+OUTPUT_FILE = os.path.join('output', 'all_results.parquet')
+# Searches run at the same time, each in its own browser context
+MAX_CONCURRENT_SEARCHES = 4
+# Job/location pairs scraped between writes to the Parquet file
+FLUSH_EVERY = 10
+# Every column is text; Currency is always null so its type can't be inferred
+SCHEMA = pa.schema([(field, pa.string()) for field in FIELDNAMES])
+
+def read_csv(filename, *columns):
+    """Read CSV file and return a tuple of the stripped named columns per row"""
     with open(filename, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+        reader = csv.reader(f)
+        header = next(reader, [])
+        indexes = [header.index(column) for column in columns]
+        return [tuple(row[i].strip() for i in indexes) for row in reader if row]
 
-def main():
+def write_rows(writer, rows):
+    """Append scraped rows to the Parquet file as one row group"""
+    if rows:
+        writer.write_table(pa.Table.from_pylist(rows, schema=SCHEMA))
+
+async def main():
     # Read the CSV files
     try:
-        locations = read_csv('country.csv')
-        jobs = read_csv('jobs.csv')
-    except FileNotFoundError as e:
+        locations = read_csv('country.csv', 'city', 'country')
+        jobs = read_csv('jobs.csv', 'job_title')
+    except (FileNotFoundError, ValueError) as e:
         print(f"Error: {e}")
         return
 
-    # Process each job and location combination
-    for job in jobs:
-        job_title = job.get('job_title', '').strip()
-        if not job_title:
-            continue
+    # Format each location once as "city-country" (replace spaces with hyphens)
+    location_strs = [
+        f"{city.lower().replace(' ', '-')}-{country.lower().replace(' ', '-')}"
+        for city, country in locations
+        if city and country
+    ]
+
+    # Every job and location combination to scrape
+    searches = [
+        (job_title, location_str)
+        for (job_title,) in jobs
+        if job_title
+        for location_str in location_strs
+    ]
+
+    # Set the parameters as requested
+    batch_size = 7
+    save_interval = 50
+    max_records = 500
+    max_show_more_clicks = 17
 
-        for location in locations:
-            city = location.get('city', '').strip()
-            country = location.get('country', '').strip()
-            
-            if not city or not country:
-                continue
+    logger = setup_logging()
+    os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
+    writer = pq.ParquetWriter(OUTPUT_FILE, SCHEMA)
+    all_rows = []
+    scraped_pairs = 0
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
 
-            # Format location as "city-country" (replace spaces with hyphens)
-            location_str = f"{city.lower().replace(' ', '-')}-{country.lower().replace(' ', '-')}"
-            
-            # Set the parameters as requested
-            batch_size = 07
-            save_interval = 50
-            max_records = 500
-            max_show_more_clicks = 17
-            
+    async def scrape_search(browser, job_title, location_str):
+        nonlocal all_rows, scraped_pairs
+        async with semaphore:
             print(f"\n{'='*60}")
             print(f"Scraping: {job_title} in {location_str}")
             print(f"Batch size: {batch_size}, Save interval: {save_interval}")
             print(f"Max records: {max_records}, Show more clicks: {max_show_more_clicks}")
             print("="*60)
-            
-            # Run the scraper with the specified parameters
+
+            # Run the scraper with the specified parameters; scrape() opens its
+            # own context so concurrent searches don't share cookies
             try:
-                parse(
-                    job_title, 
+                rows = await scrape(
+                    browser,
+                    job_title,
                     location_str,
+                    logger,
                     batch_size=batch_size,
                     save_interval=save_interval,
                     max_records=max_records,
                     max_show_more_clicks=max_show_more_clicks
                 )
+                # Extend only after the await; another search may have
+                # flushed and replaced all_rows in the meantime
+                all_rows.extend(rows)
             except Exception as e:
                 print(f"Error processing {job_title} in {location_str}: {str(e)}")
                 # Print traceback for better error diagnosis
                 import traceback
                 traceback.print_exc()
 
+            scraped_pairs += 1
+            if scraped_pairs % FLUSH_EVERY == 0:
+                write_rows(writer, all_rows)
+                all_rows = []
+
+    # Covers the browser launch too, so the Parquet file always gets its footer
+    try:
+        # One browser for the whole sweep, running several searches at once
+        async with async_playwright() as playwright:
+            browser = await launch_browser(playwright)
+            try:
+                await asyncio.gather(*(scrape_search(browser, job_title, location_str)
+                                       for job_title, location_str in searches))
+            finally:
+                await browser.close()
+    finally:
+        write_rows(writer, all_rows)
+        writer.close()
+        print(f"Combined results written to: {OUTPUT_FILE}")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())